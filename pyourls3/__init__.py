@@ -1,4 +1,5 @@
 from pyourls3.client import *
+from pyourls3.async_client import AsyncYourls
 
 name = "pyourls3"
 version = "1.0.1"
@@ -0,0 +1,210 @@
+import asyncio
+import importlib.util
+
+import pyourls3
+from pyourls3 import exceptions
+from pyourls3.client import _YourlsBase
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_http2 = importlib.util.find_spec("h2") is not None  # needed by httpx for HTTP/2 support
+
+
+class AsyncYourls(_YourlsBase):
+    """
+    Asynchronous client for Pyourls3, built on httpx. Requires httpx to be installed.
+
+    :param addr: required, string. The base address that the YOURLS installation resides at.
+    :param user: string. Username if not using key authorisation
+    :param passwd: required if using user, string. Password for username/password auth.
+    :param key: string. Can only be used if user and password are not specified.
+    """
+
+    def __init__(self, addr, user=None, passwd=None, key=None):
+        if httpx is None:
+            raise ImportError("AsyncYourls requires httpx, install it with 'pip install httpx'")
+
+        super().__init__(addr, user=user, passwd=passwd, key=key)
+
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            http2=_http2,
+            headers={"user-agent": "pyourls3/{}".format(pyourls3.version),
+                     "content-type": "application/x-www-form-urlencoded"},
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying connection pool.
+        """
+
+        await self._client.aclose()
+
+    async def ping(self):
+        """
+        Checks the credentials against the server. Credentials are otherwise only checked by the first real request.
+
+        :return: True
+
+        :raises: pyourls3.exceptions.Pyourls3APIError
+        """
+
+        self._check_auth(await self._post(None))
+        return True
+
+    async def shorten(self, url, keyword=None, title=None):
+        """
+        Sends an API request to shorten a specified URL.
+
+        :param url: required, string. URL to be shortened.
+        :param keyword: string. Custom alias for the URL
+        :param title: string. Custom title for  the URL.
+        :return: dictionary. Full JSON response from the API, parsed into a dict
+
+        :raises: pyourls3.exceptions.Pyourls3ParamError, pyourls3.exceptions.Pyourls3HTTPError,
+          pyourls3.exceptions.Pyourls3APIError, pyourls3.exceptions.Pyourls3URLAlreadyExistsError
+        """
+
+        if not url:
+            raise exceptions.Pyourls3ParamError("url")
+
+        j = await self._call("shorturl", url=url, keyword=keyword, title=title)
+        self._check_status(j, url)
+        return j
+
+    async def shorten_many(self, urls):
+        """
+        Shortens several URLs concurrently over the client's connection pool.
+
+        :param urls: required, iterable of strings. URLs to be shortened.
+        :return: list. Full JSON responses from the API, in the same order as urls.
+
+        :raises: see shorten. The first error raised is propagated.
+        """
+
+        return await asyncio.gather(*[self.shorten(u) for u in urls])
+
+    async def update(self, url, keyword=None):
+        """
+        Updates the given keyword with a new URL.
+
+        :param url: required, string. URL to be shortened.
+        :param keyword: string. Custom alias for the URL
+        :return: dictionary. Full JSON response from the API, parsed into a dict
+
+        :raises: pyourls3.exceptions.Pyourls3ParamError, pyourls3.exceptions.Pyourls3HTTPError,
+          pyourls3.exceptions.Pyourls3APIError
+        """
+
+        if not url:
+            raise exceptions.Pyourls3ParamError("url")
+
+        j = await self._call("update", shorturl=url, url=keyword)
+        self._check_status(j, url)
+        return j
+
+    async def expand(self, url):
+        """
+        Expands a specified URL or alias into it's full form.
+
+        :param url: required, string. URL or alias for shortened link.
+        :return: string. Expanded URL.
+        """
+
+        if not url:
+            raise exceptions.Pyourls3ParamError("url")
+
+        j = await self._call("expand", shorturl=url)
+        self._check_message(j)
+        return j["longurl"]
+
+    async def expand_many(self, urls):
+        """
+        Expands several URLs or aliases concurrently over the client's connection pool.
+
+        :param urls: required, iterable of strings. URLs or aliases for shortened links.
+        :return: list. Expanded URLs, in the same order as urls.
+
+        :raises: see expand. The first error raised is propagated.
+        """
+
+        return await asyncio.gather(*[self.expand(u) for u in urls])
+
+    async def stats(self):
+        """
+        Returns the overall installation stats.
+
+        :return: string. Partial JSON response returned by the API.
+
+        :raises: pyourls3.exceptions.Pyourls3HTTPError
+        """
+
+        return (await self._call("stats"))["stats"]
+
+    async def delete(self, keyword):
+        """
+        Deletes the link with the given keyword
+
+        :param url: required, string. URL or alias of target redirect.
+
+        """
+
+        if not keyword:
+            raise exceptions.Pyourls3ParamError("url")
+
+        r = await self._post("delete", shorturl=keyword)
+        self._check_auth(r)
+        if r.status_code == 200:
+            return True
+        else:
+            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+
+    async def url_stats(self, url):
+        """
+        Detailed stats about a specifc URL or alias.
+
+        :param url: required, string. URL or alias of target redirect.
+        :return: dict. Partial JSON response, parsed into a dict.
+
+        :raises: pyourls3.exceptions.Pyourls3HTTPError, pyourls3.exceptions.Pyourls3APIError
+        """
+
+        if not url:
+            raise exceptions.Pyourls3ParamError("url")
+
+        j = await self._call("url-stats", shorturl=url)
+        self._check_message(j)
+        return j["link"]
+
+    async def _post(self, action, **specific_args):
+        """
+        Sends a single request to the API. Every HTTP call made by this class goes through here.
+
+        :param action: required, string. API action to perform, or None to send only the credentials.
+        :param specific_args: action specific arguments. Arguments set to None are not sent.
+        :return: httpx.Response. Raw response from the server.
+        """
+
+        return await self._client.post(self.api_endpoint, content=self._body(action, specific_args))
+
+    async def _call(self, action, **specific_args):
+        """
+        Sends a request to the API and parses the JSON response.
+
+        :param action: required, string. API action to perform.
+        :param specific_args: action specific arguments. Arguments set to None are not sent.
+        :return: dictionary. Full JSON response from the API, parsed into a dict
+
+        :raises: pyourls3.exceptions.Pyourls3HTTPError
+        """
+
+        return self._parse(await self._post(action, **specific_args))
@@ -1,29 +1,51 @@
+import functools
+import logging
+import urllib.parse
+
 import requests
+import requests.adapters
 import urllib3
 
 import pyourls3
 from pyourls3 import exceptions
-import json
 
+try:
+    import ijson  # optional, lets stats_fields stream the response instead of buffering it
+except ImportError:
+    ijson = None
 
-class Yourls:
-    """
-    Base class for Pyourls3
+try:
+    import orjson as _json  # decodes straight from bytes, noticeably faster on large payloads
+except ImportError:
+    import json as _json
 
-    :param addr: required, string. The base address that the YOURLS installation resides at.
-    :param user: string. Username if not using key authorisation
-    :param passwd: required if using user, string. Password for username/password auth.
-    :param key: string. Can only be used if user and password are not specified.
+logger = logging.getLogger(__name__)
+
+
+def _retry_policy():
+    # urllib3 1.26 renamed method_whitelist to allowed_methods
+    retry_args = {"total": 3, "backoff_factor": 0.2, "status_forcelist": [502, 503, 504], "raise_on_status": False}
+    try:
+        return urllib3.util.Retry(allowed_methods=["POST"], **retry_args)
+    except TypeError:
+        return urllib3.util.Retry(method_whitelist=["POST"], **retry_args)
+
+
+class _YourlsBase:
+    """
+    Argument validation and response checks shared by the sync and async clients.
     """
 
+    _ACTIONS = ("shorturl", "update", "expand", "stats", "delete", "url-stats")
+
     def __init__(self, addr, user=None, passwd=None, key=None):
 
         if not addr:
             raise exceptions.Pyourls3ParamError("API URL")
 
-        scheme, _, _, _, _, _, _ = urllib3.util.parse_url(addr)  # checking for a protocol in the URL
+        scheme, sep, _ = addr.partition("://")  # checking for a protocol in the URL
 
-        if not scheme:
+        if not sep or not scheme.isalpha():
             raise exceptions.Pyourls3ParamError("addr")
 
         self.is_using_signature_auth = False
@@ -32,30 +54,109 @@ class Yourls:
             if key is None:
                 raise exceptions.Pyourls3ParamError("username and password or signature")
             else:
-                if type(key) is not str:
+                if not isinstance(key, str):
                     raise exceptions.Pyourls3ParamError("key")
                 self.is_using_signature_auth = True
                 self.global_args = {"signature": key}
         else:
-            if type(user) is not str:
+            if not isinstance(user, str):
                 raise exceptions.Pyourls3ParamError("user")
-            elif type(passwd) is not str:
+            elif not isinstance(passwd, str):
                 raise exceptions.Pyourls3ParamError("passwd")
             self.global_args = {"username": user, "password": passwd}
 
         self.global_args["format"] = "json"
+        # url-encoded start of every request body, per action; None sends only the credentials
+        self._body_prefixes = {a: urllib.parse.urlencode({**self.global_args, "action": a}) for a in self._ACTIONS}
+        self._body_prefixes[None] = urllib.parse.urlencode(self.global_args)
 
         if addr[-1] != "/":  # I like trailing slashes
             addr += "/"
 
         self.api_endpoint = addr + "yourls-api.php"
 
-        self.session = requests.session()
-        self.session.headers.update = {"user-agent": "pyourls3/{}".format(pyourls3.version)}
+    def _body(self, action, specific_args):
+        # YOURLS reads its arguments from $_REQUEST, so the body has to stay form-encoded rather than JSON
+        args = [(k, v) for k, v in specific_args.items() if v is not None]
+        if not args:
+            return self._body_prefixes[action]
+        return self._body_prefixes[action] + "&" + urllib.parse.urlencode(args)
 
-        if self.session.post(self.api_endpoint, data={**self.global_args}).status_code == 403:
+    @staticmethod
+    def _check_auth(r):
+        if r.status_code == 403:
             raise exceptions.Pyourls3APIError("credentials are invalid or incorrect: forbidden", 403)
 
+    def _check_response(self, r):
+        # works on both requests and httpx responses
+        self._check_auth(r)
+        # error pages from the web server or a proxy in front of YOURLS aren't worth decoding. The status code alone
+        # can't be used for this, as YOURLS sends its own API errors as JSON with a 4xx status.
+        if "json" not in r.headers.get("content-type", ""):
+            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+
+    def _parse(self, r):
+        self._check_response(r)
+        try:
+            return _json.loads(r.content)
+        except _json.JSONDecodeError:
+            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+
+    @staticmethod
+    def _check_status(j, url):
+        # shorturl and update report failure through the "status" field
+        if not j["status"] == "success":
+            if j["code"] == "error:url":
+                raise exceptions.Pyourls3URLAlreadyExistsError(url)
+            else:
+                raise exceptions.Pyourls3APIError(j["message"], j["code"])
+
+    @staticmethod
+    def _check_message(j):
+        # expand and url-stats report failure through the "message" field
+        if not j["message"] == "success":
+            raise exceptions.Pyourls3APIError(j["message"].split(": ")[1], j["code"])  # message returns "error: blah"
+
+
+class Yourls(_YourlsBase):
+    """
+    Base class for Pyourls3
+
+    :param addr: required, string. The base address that the YOURLS installation resides at.
+    :param user: string. Username if not using key authorisation
+    :param passwd: required if using user, string. Password for username/password auth.
+    :param key: string. Can only be used if user and password are not specified.
+    """
+
+    def __init__(self, addr, user=None, passwd=None, key=None):
+        super().__init__(addr, user=user, passwd=passwd, key=key)
+
+        self.session = requests.session()
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_retry_policy())
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.session.headers.update({"user-agent": "pyourls3/{}".format(pyourls3.version),
+                                     "content-type": "application/x-www-form-urlencoded",
+                                     "accept-encoding": "gzip, deflate",
+                                     "connection": "keep-alive"})
+
+        # alias -> long URL only changes through update/delete, which clear this
+        self._expand_cached = functools.lru_cache(maxsize=4096)(self._expand)
+
+    def ping(self):
+        """
+        Checks the credentials against the server. Credentials are otherwise only checked by the first real request.
+
+        :return: True
+
+        :raises: pyourls3.exceptions.Pyourls3APIError
+        """
+
+        self._check_auth(self._post(None))
+        return True
+
     def shorten(self, url, keyword=None, title=None):
         """
         Sends an API request to shorten a specified URL.
@@ -72,26 +173,8 @@ class Yourls:
         if not url:
             raise exceptions.Pyourls3ParamError("url")
 
-        specific_args = {"action": "shorturl", "url": url}
-
-        if keyword is not None:
-            specific_args["keyword"] = keyword
-
-        if title is not None:
-            specific_args["title"] = title
-
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
-        try:
-            j = r.json()
-        except json.decoder.JSONDecodeError:
-            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
-
-        if not j["status"] == "success":
-            if j["code"] == "error:url":
-                raise exceptions.Pyourls3URLAlreadyExistsError(url)
-            else:
-                raise exceptions.Pyourls3APIError(j["message"], j["code"])
-
+        j = self._call("shorturl", url=url, keyword=keyword, title=title)
+        self._check_status(j, url)
         return j
 
     def update(self, url, keyword=None):
@@ -109,27 +192,16 @@ class Yourls:
         if not url:
             raise exceptions.Pyourls3ParamError("url")
 
-        specific_args = {"action": "update", "shorturl": url, "url": keyword}
-
-
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
-        print(specific_args)
-        try:
-            j = r.json()
-        except json.decoder.JSONDecodeError:
-            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
-
-        if not j["status"] == "success":
-            if j["code"] == "error:url":
-                raise exceptions.Pyourls3URLAlreadyExistsError(url)
-            else:
-                raise exceptions.Pyourls3APIError(j["message"], j["code"])
-
+        j = self._call("update", shorturl=url, url=keyword)
+        logger.debug("update args: shorturl=%s url=%s", url, keyword)
+        self._expand_cached.cache_clear()
+        self._check_status(j, url)
         return j
 
     def expand(self, url):
         """
-        Expands a specified URL or alias into it's full form.
+        Expands a specified URL or alias into it's full form. Successful results are cached per instance until
+        update or delete is called.
 
         :param url: required, string. URL or alias for shortened link.
         :return: string. Expanded URL.
@@ -138,17 +210,11 @@ class Yourls:
         if not url:
             raise exceptions.Pyourls3ParamError("url")
 
-        specific_args = {"action": "expand", "shorturl": url}
-
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
-        try:
-            j = r.json()
-        except json.decoder.JSONDecodeError:
-            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
-
-        if not j["message"] == "success":
-            raise exceptions.Pyourls3APIError(j["message"].split(": ")[1], j["code"])  # message returns "error: blah"
+        return self._expand_cached(url)
 
+    def _expand(self, url):
+        j = self._call("expand", shorturl=url)
+        self._check_message(j)
         return j["longurl"]
 
     def stats(self):
@@ -160,15 +226,56 @@ class Yourls:
         :raises: pyourls3.exceptions.Pyourls3HTTPError
         """
 
-        specific_args = {"action": "stats"}
+        return self._call("stats")["stats"]
 
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
-        try:
-            j = r.json()
-        except json.decoder.JSONDecodeError:
-            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+    def stats_fields(self, *keys):
+        """
+        Returns only the given keys from the overall installation stats. If ijson is installed the response is
+        parsed as it streams in and reading stops once every key has been found; otherwise this falls back to
+        filtering the result of stats.
 
-        return j["stats"]
+        :param keys: strings. Stats keys to return, for example "total_links". Returns every key if none are given.
+        :return: dict. The requested stats that were present in the response.
+
+        :raises: pyourls3.exceptions.Pyourls3HTTPError
+        """
+
+        if ijson is None:
+            r = self._post("stats")
+            j = self._parse(r)
+            if not isinstance(j.get("stats"), dict):
+                raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+            return {k: v for k, v in j["stats"].items() if not keys or k in keys}
+
+        wanted = set(keys)
+        found = {}
+        seen_stats = False
+
+        def watch(events):
+            # kvitems yields nothing both for an empty stats object and for a response without one
+            nonlocal seen_stats
+            for prefix, event, value in events:
+                if prefix == "stats" and event == "start_map":
+                    seen_stats = True
+                yield prefix, event, value
+
+        with self._post("stats", stream=True) as r:
+            self._check_response(r)
+            r.raw.decode_content = True
+            try:
+                # use_float so numbers come back the same type as from stats()
+                for k, v in ijson.kvitems(watch(ijson.parse(r.raw, use_float=True)), "stats"):
+                    if not wanted or k in wanted:
+                        found[k] = v
+                        if wanted and len(found) == len(wanted):
+                            break
+            except ijson.JSONError:
+                raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+
+            if not seen_stats:
+                raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+
+        return found
 
     def delete(self, keyword):
         """
@@ -181,9 +288,9 @@ class Yourls:
         if not keyword:
             raise exceptions.Pyourls3ParamError("url")
 
-        specific_args = {"action": "delete", "shorturl": keyword}
-
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
+        r = self._post("delete", shorturl=keyword)
+        self._expand_cached.cache_clear()
+        self._check_auth(r)
         if r.status_code == 200:
             return True
         else:
@@ -202,15 +309,33 @@ class Yourls:
         if not url:
             raise exceptions.Pyourls3ParamError("url")
 
-        specific_args = {"action": "url-stats", "shorturl": url}
+        j = self._call("url-stats", shorturl=url)
+        self._check_message(j)
+        return j["link"]
 
-        r = requests.post(self.api_endpoint, data={**self.global_args, **specific_args})
-        try:
-            j = r.json()
-        except json.decoder.JSONDecodeError:
-            raise exceptions.Pyourls3HTTPError(r.status_code, self.api_endpoint)
+    def _post(self, action, stream=False, **specific_args):
+        """
+        Sends a single request to the API. Every HTTP call made by this class goes through here.
 
-        if not j["message"] == "success":
-            raise exceptions.Pyourls3APIError(j["message"].split(": ")[1], j["code"])  # message returns "error: blah"
+        :param action: required, string. API action to perform, or None to send only the credentials.
+        :param stream: bool. Leave the body unread so it can be consumed from response.raw.
+        :param specific_args: action specific arguments. Arguments set to None are not sent.
+        :return: requests.Response. Raw response from the server.
+        """
 
-        return j["link"]
+        return self.session.post(self.api_endpoint,
+                                 data=self._body(action, specific_args),
+                                 stream=stream)
+
+    def _call(self, action, **specific_args):
+        """
+        Sends a request to the API and parses the JSON response.
+
+        :param action: required, string. API action to perform.
+        :param specific_args: action specific arguments. Arguments set to None are not sent.
+        :return: dictionary. Full JSON response from the API, parsed into a dict
+
+        :raises: pyourls3.exceptions.Pyourls3HTTPError
+        """
+
+        return self._parse(self._post(action, **specific_args))
@@ -15,16 +15,12 @@ setuptools.setup(
     packages=["pyourls3"],
     classifiers=[
         "Programming Language :: Python :: 3",
-	"Programming Language :: Python :: 3.5",
-	"Programming Language :: Python :: 3.6",
-	"Programming Language :: Python :: 3.7",
+	"Programming Language :: Python :: 3.8",
         "License :: OSI Approved :: Mozilla Public License 2.0 (MPL 2.0)",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.5',
-    install_requires=["requests",
-                      "certifi>=2017.4.17",
-                      "chardet<3.1.0,>=3.0.2",
-                      "idna<2.9,>=2.5",
-                      "urllib3!=1.25.0,!=1.25.1,<1.26,>=1.21.1"]
+    python_requires='>=3.8',
+    install_requires=["requests>=2.28"],
+    extras_require={"http2": ["httpx[http2]>=0.27"],
+                    "speedups": ["orjson", "ijson"]}
 )
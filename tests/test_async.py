@@ -0,0 +1,52 @@
+import asyncio
+
+from pyourls3 import exceptions
+import pytest
+import tests
+import tests.sharevar
+
+httpx = pytest.importorskip("httpx")
+
+from pyourls3 import async_client
+
+
+# tests for the async client, these use the same Flask server as the sync tests
+
+# the client's connection pool is bound to the loop it first ran on, so every test shares this one
+loop = asyncio.new_event_loop()
+
+
+def run(coro):
+    return loop.run_until_complete(coro)
+
+
+@pytest.fixture(scope="module")
+def instance():
+    c = async_client.AsyncYourls(tests.sharevar.standard_url, key="12345")
+    yield c
+    run(c.aclose())
+    loop.close()
+    tests.sharevar.modifier = None
+
+
+def test_a_url_exists(instance):
+    with pytest.raises(exceptions.Pyourls3ParamError):
+        run(instance.shorten(""))
+
+
+def test_a_shorten_many(instance):
+    r = run(instance.shorten_many(["https://www.google.com", "https://www.example.com"]))
+    assert len(r) == 2
+    assert all(j["status"] == "success" for j in r)
+
+
+def test_a_expand_many(instance):
+    r = run(instance.expand_many(["https://www.google.com", "https://www.example.com"]))
+    assert r == ["https://www.example.com", "https://www.example.com"]
+
+
+def test_a_garbled_json(instance):
+    tests.sharevar.modifier = "garbledjson"
+    with pytest.raises(exceptions.Pyourls3HTTPError):
+        run(instance.expand("https://www.google.com"))
+    tests.sharevar.modifier = None
@@ -27,10 +27,22 @@ def test_e_request_params_correct(instance):
 def test_e_garbled_json(instance):
     tests.sharevar.modifier = "garbledjson"
     with pytest.raises(exceptions.Pyourls3HTTPError):
-        instance.expand("https://www.google.com")
+        instance.expand("https://www.bing.com")
 
 
 def test_e_generic_error(instance):
     tests.sharevar.modifier = "error"
     with pytest.raises(exceptions.Pyourls3APIError):
-        instance.expand("https://www.google.com")
+        instance.expand("https://www.duckduckgo.com")
+
+
+def test_e_cached(instance):
+    u = "https://www.yahoo.com"
+    tests.sharevar.modifier = None
+    instance.expand(u)
+    # answered from the cache, so the server's error must not be seen
+    tests.sharevar.modifier = "error"
+    assert instance.expand(u) == "https://www.example.com"
+    instance.delete(u)
+    with pytest.raises(exceptions.Pyourls3APIError):
+        instance.expand(u)
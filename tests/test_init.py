@@ -45,11 +45,21 @@ def test_i_api_key():
 
 def test_i_user_agent():
     inst = client.Yourls("http://example.com", key="1234")
-    assert "user-agent" in inst.session.headers.update
+    assert "user-agent" in inst.session.headers
+    assert "gzip" in inst.session.headers["accept-encoding"]
 
 
 def test_i_creds_correct():
     tests.sharevar.modifier = "badauth"
+    inst = client.Yourls(tests.sharevar.standard_url, key="12345")  # no request is made here
     with pytest.raises(exceptions.Pyourls3APIError):
-        client.Yourls(tests.sharevar.standard_url, key="12345")
-    tests.sharevar.modifier = None
\ No newline at end of file
+        inst.ping()
+    tests.sharevar.modifier = None
+    assert inst.ping()
+
+
+def test_i_credential_str_subclass():
+    class Secret(str):
+        pass
+
+    client.Yourls("http://example.com", key=Secret("123456789"))
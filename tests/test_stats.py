@@ -16,3 +16,21 @@ def test_s_garbled_json(instance):
     tests.sharevar.modifier = "garbledjson"
     with pytest.raises(exceptions.Pyourls3HTTPError):
         instance.stats()
+
+
+def test_s_not_json(instance):
+    tests.sharevar.modifier = "html"
+    with pytest.raises(exceptions.Pyourls3HTTPError):
+        instance.stats()
+
+
+def test_s_fields(instance):
+    tests.sharevar.modifier = None
+    assert instance.stats_fields("total_links") == {"total_links": "3"}
+    assert instance.stats_fields() == {"total_links": "3", "total_clicks": "2"}
+
+
+def test_s_fields_error(instance):
+    tests.sharevar.modifier = "error"
+    with pytest.raises(exceptions.Pyourls3HTTPError):
+        instance.stats_fields("total_links")
@@ -59,6 +59,13 @@ def proc_cron():
         if tests.sharevar.modifier == "garbledjson":
             response = flask.Response("this is not valid json")
 
+        elif tests.sharevar.modifier == "html":
+            response = flask.Response("<html><body>500 Internal Server Error</body></html>", status=500)
+            return response
+
+        elif tests.sharevar.modifier == "error":
+            response = flask.Response('{"errorCode": 400, "message": "message goes here"}', status=400)
+
         else:
             response = flask.Response('{"stats": {"total_links": "3","total_clicks": "2"},"statusCode": 200,"message":'
                                       ' "success"}')
@@ -81,5 +88,11 @@ def proc_cron():
         response.headers["content-type"] = "application/json"
         return response
 
+    elif option == "delete":
+        response = flask.Response('{"message": "success: deleted", "statusCode": 200}')
+
+        response.headers["content-type"] = "application/json"
+        return response
+
 if __name__ == "__main__":
     app.run()
\ No newline at end of file